@@ -1,7 +1,7 @@
 import os
 
 import pandas as pd
-from villard.io import PandasWriter, PandasReader
+from villard.io import PandasWriter, PandasReader, PickleReader, PickleWriter
 
 
 def test_pandas_writer():
@@ -23,3 +23,16 @@ def test_pandas_writer_without_index():
     assert df.index.equals(pd.RangeIndex(start=0, stop=3, step=1))
 
     os.remove("test.csv")
+
+
+def test_writer_keeps_user_hardlinks(tmp_path):
+    path = str(tmp_path / "test.pkl")
+    link = str(tmp_path / "link.pkl")
+    with open(path, "wb") as f:
+        f.write(b"old")
+    os.link(path, link)
+
+    PickleWriter().write_data(path, "new")
+
+    assert os.path.samefile(path, link)
+    assert PickleReader().read_data(link) == "new"
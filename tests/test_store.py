@@ -0,0 +1,69 @@
+import os
+
+from villard.store import ContentStore
+
+
+def _write(store, path, content):
+    staging_path = store.staging_path(path)
+    with open(staging_path, "wb") as f:
+        f.write(content)
+    return store.put(staging_path, path)
+
+
+def test_identical_outputs_are_stored_once(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    path_a = str(tmp_path / "run-a" / "out.csv")
+    path_b = str(tmp_path / "run-b" / "out.csv")
+
+    digest_a = _write(store, path_a, b"a,b\n1,2\n")
+    digest_b = _write(store, path_b, b"a,b\n1,2\n")
+
+    assert digest_a == digest_b
+    assert os.path.samefile(path_a, path_b)
+    assert os.path.samefile(path_a, store.object_path(digest_a))
+    assert os.listdir(store.tmp_dir) == []
+
+
+def test_rewriting_a_path_keeps_other_links_intact(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    path_a = str(tmp_path / "run-a" / "out.csv")
+    path_b = str(tmp_path / "run-b" / "out.csv")
+
+    _write(store, path_a, b"old")
+    _write(store, path_b, b"old")
+    _write(store, path_b, b"new")
+
+    with open(path_a, "rb") as f:
+        assert f.read() == b"old"
+    with open(path_b, "rb") as f:
+        assert f.read() == b"new"
+
+
+def test_resized_object_is_replaced(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    path = str(tmp_path / "run-a" / "out.csv")
+
+    digest = _write(store, path, b"old")
+    object_path = store.object_path(digest)
+    os.chmod(object_path, 0o644)
+    with open(object_path, "wb") as f:
+        f.write(b"changed")
+
+    assert _write(store, path, b"old") == digest
+    assert store.hash_file(object_path) == digest
+
+
+def test_same_size_modified_object_is_replaced(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    path = str(tmp_path / "run-a" / "out.csv")
+
+    digest = _write(store, path, b"old")
+    object_path = store.object_path(digest)
+    os.chmod(object_path, 0o644)
+    with open(object_path, "wb") as f:
+        f.write(b"new")
+
+    assert _write(store, path, b"old") == digest
+    assert store.hash_file(object_path) == digest
+    with open(path, "rb") as f:
+        assert f.read() == b"old"
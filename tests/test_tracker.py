@@ -0,0 +1,34 @@
+import os
+
+import joblib
+from villard.tracker import ExperimentTracker
+
+
+def test_commit_writes_output_hashes(tmp_path):
+    tracker = ExperimentTracker("run", str(tmp_path))
+    tracker.track("accuracy", 0.9)
+    tracker.track_output("trained_model", "abc123")
+    tracker.commit()
+
+    run_dir = os.path.join(str(tmp_path), "run")
+    assert joblib.load(os.path.join(run_dir, "experiment.pkl")) == {"accuracy": 0.9}
+    assert joblib.load(os.path.join(run_dir, "outputs.pkl")) == {
+        "trained_model": "abc123"
+    }
+
+
+def test_commit_without_outputs_skips_output_hashes(tmp_path):
+    tracker = ExperimentTracker("run", str(tmp_path))
+    tracker.track("accuracy", 0.9)
+    tracker.commit()
+
+    assert not os.path.exists(os.path.join(str(tmp_path), "run", "outputs.pkl"))
+
+
+def test_commit_writes_output_hashes_without_tracked_values(tmp_path):
+    tracker = ExperimentTracker("run", str(tmp_path))
+    tracker.track_output("trained_model", "abc123")
+    tracker.commit()
+
+    outputs_path = os.path.join(str(tmp_path), "run", "outputs.pkl")
+    assert joblib.load(outputs_path) == {"trained_model": "abc123"}
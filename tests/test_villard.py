@@ -0,0 +1,81 @@
+import os
+import pickle
+import shutil
+import stat
+
+import pytest
+from villard import Villard
+from villard.store import ContentStore
+from villard.tracker import ExperimentTracker
+
+
+def _pipeline(tmp_path, catalog_keys):
+    pipeline = Villard()
+    pipeline.data_catalog = {
+        key: {"path": str(tmp_path / key / "out.pkl"), "type": "DT_PICKLE"}
+        for key in catalog_keys
+    }
+    pipeline.content_store = ContentStore(str(tmp_path / "store"))
+    pipeline.experiment_tracker = ExperimentTracker("run", str(tmp_path / "exp"))
+    return pipeline
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def test_write_data_with_content_store_tracks_output_hash(tmp_path):
+    pipeline = _pipeline(tmp_path, ["a", "b"])
+    pipeline.write_data("a", {"x": 1})
+    pipeline.write_data("b", {"x": 1})
+
+    hashes = pipeline.experiment_tracker.output_hashes
+    path_a = pipeline.data_catalog["a"]["path"]
+    path_b = pipeline.data_catalog["b"]["path"]
+
+    assert hashes["a"] == hashes["b"]
+    assert hashes["a"] == pipeline.content_store.hash_file(path_a)
+    assert os.path.samefile(path_a, path_b)
+    assert _read(path_a) == {"x": 1}
+
+
+def test_write_data_without_content_store_keeps_stored_objects(tmp_path):
+    pipeline = _pipeline(tmp_path, ["a", "b"])
+    pipeline.write_data("a", "same")
+    pipeline.write_data("b", "same")
+    digest = pipeline.experiment_tracker.output_hashes["a"]
+    store = pipeline.content_store
+
+    pipeline.content_store = None
+    pipeline.write_data("b", "changed")
+
+    assert _read(pipeline.data_catalog["b"]["path"]) == "changed"
+    assert _read(pipeline.data_catalog["a"]["path"]) == "same"
+    assert store.hash_file(store.object_path(digest)) == digest
+
+
+def test_write_data_failure_removes_staging_dir(tmp_path):
+    pipeline = _pipeline(tmp_path, ["a"])
+
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pipeline.write_data("a", lambda: None)
+
+    assert os.listdir(pipeline.content_store.tmp_dir) == []
+    assert not os.path.exists(pipeline.data_catalog["a"]["path"])
+
+
+def test_write_data_after_content_store_is_removed(tmp_path):
+    pipeline = _pipeline(tmp_path, ["a"])
+    pipeline.write_data("a", "stored")
+    path = pipeline.data_catalog["a"]["path"]
+
+    shutil.rmtree(pipeline.content_store.root_dir)
+    pipeline.content_store = None
+    assert os.stat(path).st_nlink == 1
+    assert not os.stat(path).st_mode & stat.S_IWUSR
+
+    pipeline.write_data("a", "rewritten")
+
+    assert _read(path) == "rewritten"
+    assert os.stat(path).st_mode & stat.S_IWUSR
@@ -1,5 +1,6 @@
 import os
 import pickle
+import stat
 
 import pandas as pd
 from termcolor import colored
@@ -15,6 +16,13 @@ class BaseDataWriter:
         if (not os.path.exists(dirname)) and (dirname != ""):
             os.makedirs(dirname)
 
+        # Outputs written through a content store (see `villard.store.ContentStore`)
+        # are read-only and may share their bytes with stored objects. Unlink such
+        # a path so the writer creates a new file instead of writing through to
+        # every linked copy, or failing on the read-only mode.
+        if os.path.exists(path) and not (os.stat(path).st_mode & stat.S_IWUSR):
+            os.remove(path)
+
 
 class PickleWriter(BaseDataWriter):
     def write_data(self, path: str, data: object, *args, **kwargs) -> None:
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import uuid
+
+
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+class ContentStore:
+    """A content-addressed object store for written catalog outputs.
+
+    Each written file is hashed and kept once under `objects/`, keyed by its
+    digest. The catalog path is then materialized as a hardlink to the stored
+    object, so identical outputs across runs share the same bytes on disk.
+    Stored objects are made read-only to protect every run that links to them;
+    writers replace a read-only catalog path instead of writing into it.
+
+    Args:
+        root_dir: Directory holding the stored objects.
+        chunk_size: Number of bytes read at a time while hashing.
+    """
+
+    def __init__(self, root_dir: str, chunk_size: int = 1024 * 1024):
+        self.root_dir = root_dir
+        self.chunk_size = chunk_size
+
+        self.objects_dir = os.path.join(root_dir, "objects")
+        self.tmp_dir = os.path.join(root_dir, "tmp")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def staging_path(self, path: str) -> str:
+        """Return a fresh path inside the store to write an output to.
+
+        The staging path keeps the basename of `path`, so writers that infer
+        something from the file extension (e.g., compression) behave the same.
+        """
+        staging_dir = tempfile.mkdtemp(dir=self.tmp_dir)
+        return os.path.join(staging_dir, os.path.basename(path))
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def hash_file(self, path: str) -> str:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def put(self, staged_path: str, path: str) -> str:
+        """Move a staged file into the store and materialize it at `path`.
+
+        Args:
+            staged_path: A file previously written to a `staging_path`.
+            path: The catalog path the output should appear at.
+
+        Returns:
+            The content hash (sha256 hex digest) of the output.
+        """
+        digest = self.hash_file(staged_path)
+        object_path = self.object_path(digest)
+
+        # Identical bytes are already stored: drop the staged copy.
+        if self._is_intact(object_path, digest, os.path.getsize(staged_path)):
+            os.remove(staged_path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(staged_path, object_path)
+            os.chmod(object_path, READ_ONLY)
+        os.rmdir(os.path.dirname(staged_path))
+
+        self.materialize(digest, path)
+        return digest
+
+    def _is_intact(self, object_path: str, digest: str, size: int) -> bool:
+        """Check that a stored object still holds the bytes of `digest`.
+
+        An object with the size and read-only mode set by `put` is trusted
+        without reading it. Otherwise it is re-hashed. A same-size edit that
+        keeps the read-only mode (only possible as root, since villard writers
+        replace read-only files instead of writing into them) is not detected.
+        """
+        if not os.path.exists(object_path):
+            return False
+        st = os.stat(object_path)
+        if st.st_size != size:
+            return False
+        if stat.S_IMODE(st.st_mode) == READ_ONLY:
+            return True
+        if self.hash_file(object_path) != digest:
+            return False
+        os.chmod(object_path, READ_ONLY)
+        return True
+
+    def materialize(self, digest: str, path: str) -> None:
+        """Make the stored object with `digest` available at `path`."""
+        dirname = os.path.dirname(path)
+        if dirname != "":
+            os.makedirs(dirname, exist_ok=True)
+
+        # Link next to the destination first, then swap it in atomically. An
+        # existing file at `path` is replaced, never written through, so other
+        # links to the same object are left untouched. The temporary name is
+        # unique, so concurrent writes to the same path do not collide.
+        tmp_path = os.path.join(
+            dirname, f".{os.path.basename(path)}.{uuid.uuid4().hex}.villard-tmp"
+        )
+        try:
+            try:
+                os.link(self.object_path(digest), tmp_path)
+            except OSError:
+                # Hardlinks are not possible (e.g., across file systems): fall
+                # back to a plain copy.
+                shutil.copyfile(self.object_path(digest), tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+            raise
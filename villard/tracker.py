@@ -12,10 +12,12 @@ class ExperimentTracker:
         self.experiment_dir = experiment_dir
 
         self.experiment_dict = dict()
+        self.output_hashes = dict()
 
     def commit(self) -> None:
-        # Write experiment dict to file only if it is not empty.
-        if self.experiment_dict:
+        # Write experiment dict to file only if it or the output hashes are not
+        # empty.
+        if self.experiment_dict or self.output_hashes:
             if not self.run_name:
                 self.run_name = datetime.now().strftime("run-%Y-%m-%d-%H-%M-%S")
             if not self.experiment_dir:
@@ -37,6 +39,17 @@ class ExperimentTracker:
                 os.path.join(self.experiment_dir, self.run_name, "experiment.pkl"),
             )
 
+            # Content hashes of written outputs are kept apart from the tracked
+            # values, so they do not show up as experiment columns.
+            if self.output_hashes:
+                joblib.dump(
+                    self.output_hashes,
+                    os.path.join(self.experiment_dir, self.run_name, "outputs.pkl"),
+                )
+
     def track(self, key: str, value: Any) -> None:
         # TODO: validity checking of key and value
         self.experiment_dict[key] = value
+
+    def track_output(self, data_catalog_key: str, content_hash: str) -> None:
+        self.output_hashes[data_catalog_key] = content_hash
@@ -1,6 +1,7 @@
 import importlib
 import json
 import os
+import shutil
 import sys
 from datetime import datetime
 from typing import Any, Dict, List
@@ -13,6 +14,7 @@ from tabulate import tabulate
 from termcolor import colored
 
 from .io import *
+from .store import ContentStore
 from .tracker import ExperimentTracker
 
 
@@ -76,6 +78,7 @@ class Villard:
         cls.execution_nodes = dict()
         cls.execution_nodes_in_out_counter = dict()
         cls.experiment_tracker: ExperimentTracker = None
+        cls.content_store: ContentStore = None
 
         # Default supported data types and their corresponding loaders and writers.
         cls.supported_data_types = ["DT_PICKLE", "DT_PANDAS_DATAFRAME"]
@@ -278,6 +281,11 @@ class Villard:
             experiment_output_dir = None
         cls.experiment_tracker = ExperimentTracker(run_name, experiment_output_dir)
 
+        # Initialize content-addressed storage for written outputs if it is defined
+        # in the config file.
+        if "content_store_dir" in config:
+            cls.content_store = ContentStore(config["content_store_dir"])
+
         # Initialize data catalog if it is defined in the config file.
         if "data_catalog" in config:
             cls.data_catalog = config["data_catalog"]
@@ -382,7 +390,22 @@ class Villard:
             kwargs = dict()
         WriterClass = cls.type_to_writer_map[data_type]
         writer = WriterClass()
-        writer.write_data(data_info["path"], data, **kwargs)
+
+        if cls.content_store is None:
+            writer.write_data(data_info["path"], data, **kwargs)
+            return
+
+        # With a content store, write to a staging path first. The store keeps a
+        # single copy of identical outputs and links it back to the catalog path.
+        staging_path = cls.content_store.staging_path(data_info["path"])
+        try:
+            writer.write_data(staging_path, data, **kwargs)
+            content_hash = cls.content_store.put(staging_path, data_info["path"])
+        except Exception:
+            shutil.rmtree(os.path.dirname(staging_path), ignore_errors=True)
+            raise
+        if cls.experiment_tracker is not None:
+            cls.experiment_tracker.track_output(data_catalog_key, content_hash)
 
     def track(cls, key: str, value: Any) -> None:
         """